@@ -3,13 +3,46 @@ MULTI-AGENT CHAT SYSTEM
 Enables real-time communication between user and all AI agents
 """
 import asyncio
-import json
+import orjson
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import logging
 
+# Optional binary frames for /ws/chat clients that negotiate the subprotocol
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+
+# Chat timestamps only need second resolution (the dashboard shows
+# HH:MM:SS), so the ISO string is rebuilt once per second, not per message
+_clock_second = 0
+_clock_iso = ""
+
+
+def now_iso() -> str:
+    """Local time as an ISO string, truncated to the second (cached)"""
+    global _clock_second, _clock_iso
+    second = int(time.time())
+    if second != _clock_second:
+        _clock_second = second
+        _clock_iso = datetime.fromtimestamp(second).isoformat()
+    return _clock_iso
+
+
+def _msgpack_batch_header(count: int) -> bytes:
+    """MessagePack prefix for {"batch": [<count items>]}; items are appended pre-packed"""
+    packer = msgpack.Packer(use_bin_type=True)
+    return packer.pack_map_header(1) + packer.pack("batch") + packer.pack_array_header(count)
+
 
 class AgentType(Enum):
     """Types of agents in the system"""
@@ -28,6 +61,9 @@ class ChatMessage:
     message: str
     timestamp: str
     metadata: Optional[Dict] = None
+    # Wire encodings, computed once and shared by every connection
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _packed: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self):
         return {
@@ -36,6 +72,18 @@ class ChatMessage:
             "timestamp": self.timestamp,
             "metadata": self.metadata or {}
         }
+    
+    def to_json(self) -> str:
+        """JSON text frame payload (cached)"""
+        if self._json is None:
+            self._json = orjson.dumps(self.to_dict()).decode()
+        return self._json
+    
+    def to_msgpack(self) -> bytes:
+        """MessagePack frame payload (cached)"""
+        if self._packed is None:
+            self._packed = msgpack.packb(self.to_dict(), use_bin_type=True)
+        return self._packed
 
 
 class ChatCoordinator:
@@ -49,6 +97,19 @@ class ChatCoordinator:
         
         # Active WebSocket connections
         self.connections: Set = set()
+        # Connections that negotiated MessagePack frames (subset of connections)
+        self.binary_connections: Set = set()
+        # Tuple snapshot of connections for broadcast, rebuilt only after
+        # a connect/disconnect (None = stale)
+        self._connection_snapshot: Optional[Tuple] = None
+        # Per-connection outbound queue + writer task (drain-and-batch)
+        self.outbox_size = 256
+        self.send_timeout = 0.05  # seconds; slower clients get dropped
+        self.broadcast_chunk = 50  # connections per event-loop turn
+        self._outboxes: Dict = {}
+        self._writers: Dict = {}
+        # Close handshakes for dropped connections (kept so they aren't GC'd)
+        self._closing: Set = set()
         
         # Message history (last N messages)
         self.max_history = 100
@@ -76,14 +137,19 @@ class ChatCoordinator:
             f"Agent {agent_type.value.upper()} is now online"
         )
     
-    async def connect(self, websocket):
-        """Register a new WebSocket connection"""
+    async def connect(self, websocket, binary: bool = False):
+        """Register a new WebSocket connection (binary: MessagePack frames)"""
         self.connections.add(websocket)
+        self._connection_snapshot = None
+        if binary:
+            self.binary_connections.add(websocket)
+        self._outboxes[websocket] = asyncio.Queue(maxsize=self.outbox_size)
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket))
         self.logger.info(f"💬 New connection. Total: {len(self.connections)}")
         
         # Send recent message history to new connection
         for msg in self.message_history[-20:]:  # Last 20 messages
-            await websocket.send_text(json.dumps(msg.to_dict()))
+            self._enqueue(websocket, msg)
         
         # Welcome message
         await self.send_to_connection(
@@ -91,22 +157,96 @@ class ChatCoordinator:
             ChatMessage(
                 agent=AgentType.SYSTEM.value,
                 message="Welcome to Heist Engine Command Center! 🚀",
-                timestamp=datetime.now().isoformat()
+                timestamp=now_iso()
             )
         )
     
     async def disconnect(self, websocket):
         """Remove a WebSocket connection"""
-        self.connections.discard(websocket)
+        self._drop(websocket)
         self.logger.info(f"💬 Connection closed. Total: {len(self.connections)}")
     
-    async def send_to_connection(self, websocket, message: ChatMessage):
-        """Send message to a specific connection"""
+    def _drop(self, websocket, close_code: Optional[int] = None):
+        """
+        Forget a connection and stop its writer
+        
+        With close_code, the socket is also closed (the server gave up on a
+        live client), which ends its receive loop and lets it reconnect.
+        """
+        self.connections.discard(websocket)
+        self.binary_connections.discard(websocket)
+        self._connection_snapshot = None
+        self._outboxes.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        
+        if close_code is not None:
+            closing = asyncio.create_task(self._close_quietly(websocket, close_code))
+            self._closing.add(closing)
+            closing.add_done_callback(self._closing.discard)
+    
+    async def _close_quietly(self, websocket, code: int):
+        """Close a dropped socket, ignoring one that is already gone"""
         try:
-            await websocket.send_text(json.dumps(message.to_dict()))
+            await websocket.close(code=code)
+        except Exception:
+            pass
+    
+    def _enqueue(self, websocket, message: ChatMessage):
+        """Queue a message for the connection's writer"""
+        outbox = self._outboxes.get(websocket)
+        if outbox is None:
+            return
+        try:
+            outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.logger.warning("💬 Dropping slow chat connection (outbox full)")
+            self._drop(websocket, close_code=1013)  # 1013: try again later
+    
+    async def _writer(self, websocket):
+        """
+        Flush a connection's outbox: wait for one message, then drain
+        whatever else is already queued and send it all as one frame
+        ({"batch": [...]} when more than one message is pending).
+        Frames are stitched from each message's cached encoding.
+        """
+        outbox = self._outboxes[websocket]
+        binary = websocket in self.binary_connections
+        try:
+            while True:
+                pending = [await outbox.get()]
+                while not outbox.empty():
+                    pending.append(outbox.get_nowait())
+                
+                if binary:
+                    if len(pending) == 1:
+                        frame = pending[0].to_msgpack()
+                    else:
+                        frame = _msgpack_batch_header(len(pending)) + b"".join(
+                            msg.to_msgpack() for msg in pending
+                        )
+                    await asyncio.wait_for(websocket.send_bytes(frame), self.send_timeout)
+                else:
+                    if len(pending) == 1:
+                        frame = pending[0].to_json()
+                    else:
+                        frame = '{"batch":[' + ",".join(msg.to_json() for msg in pending) + ']}'
+                    await asyncio.wait_for(websocket.send_text(frame), self.send_timeout)
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            # The cancelled send may have left a partial frame on the wire,
+            # so the socket can't be reused: close it, don't just forget it
+            self.logger.warning("💬 Dropping slow chat connection (send timed out)")
+            self._drop(websocket, close_code=1013)
         except Exception as e:
             self.logger.error(f"Error sending to connection: {e}")
-            self.connections.discard(websocket)
+            self._drop(websocket)
+    
+    async def send_to_connection(self, websocket, message: ChatMessage):
+        """Send message to a specific connection"""
+        self._enqueue(websocket, message)
     
     async def broadcast(self, message: ChatMessage):
         """Send message to all connected clients"""
@@ -118,24 +258,30 @@ class ChatCoordinator:
         if len(self.message_history) > self.max_history:
             self.message_history = self.message_history[-self.max_history:]
         
-        # Send to all connections
-        disconnected = set()
-        for connection in self.connections:
-            try:
-                await connection.send_text(json.dumps(message.to_dict()))
-            except Exception as e:
-                self.logger.error(f"Error broadcasting: {e}")
-                disconnected.add(connection)
+        # Nobody listening: history replay covers later joiners, and the
+        # message is never encoded (encoding happens lazily in the writers)
+        if not self.connections:
+            return
         
-        # Clean up disconnected
-        self.connections -= disconnected
+        # Queue for every connection; writers coalesce what piles up and
+        # send concurrently, so one slow client never delays the rest.
+        # Large audiences are fanned out in chunks, yielding in between
+        # so HTTP handlers like /status stay responsive.
+        connections = self._connection_snapshot
+        if connections is None:
+            connections = self._connection_snapshot = tuple(self.connections)
+        for start in range(0, len(connections), self.broadcast_chunk):
+            if start:
+                await asyncio.sleep(0)
+            for connection in connections[start:start + self.broadcast_chunk]:
+                self._enqueue(connection, message)
     
     async def broadcast_system_message(self, message: str):
         """Broadcast a system message"""
         await self.broadcast(ChatMessage(
             agent=AgentType.SYSTEM.value,
             message=message,
-            timestamp=datetime.now().isoformat()
+            timestamp=now_iso()
         ))
     
     async def agent_message(self, agent_type: AgentType, message: str, metadata: Dict = None):
@@ -143,7 +289,7 @@ class ChatCoordinator:
         await self.broadcast(ChatMessage(
             agent=agent_type.value,
             message=message,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso(),
             metadata=metadata
         ))
     
@@ -24,6 +24,7 @@ from modules.the_ear import TheEar, TokenSignal
 from modules.the_eye import TheEye, ContractAudit
 from modules.the_hand import TheHand, TradeResult
 from modules.the_brain import TheBrain, AIDecision
+from modules.http_session import close_shared_session
 from chat_system import get_chat_coordinator, AgentType
 
 from dotenv import load_dotenv
@@ -505,6 +506,12 @@ class HeistEngine:
         if self.hand:
             await self.hand.stop()
         
+        if self.brain:
+            await self.brain.close()
+        
+        # Modules only borrow the shared HTTP pool; release it last
+        await close_shared_session()
+        
         # Final statistics
         hand_stats = self.hand.get_statistics() if self.hand else {}
         
@@ -547,7 +554,13 @@ async def main():
     
     # Configure API server
     port = int(os.environ.get("PORT", 10000))
-    config = uvicorn.Config(web_api.app, host="0.0.0.0", port=port, log_level="info")
+    config = uvicorn.Config(
+        web_api.app,
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        ws_per_message_deflate=web_api.WS_COMPRESS
+    )
     server = uvicorn.Server(config)
     
     engine.logger.info(f"🚀 Starting API server on port {port}...")
@@ -582,6 +595,14 @@ async def main():
 
 
 if __name__ == '__main__':
+    # Prefer uvloop's libuv event loop (engine, monitor and API server all
+    # share it); fall back to asyncio's where unavailable (e.g. Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Run the engine
     try:
         asyncio.run(main())
@@ -10,10 +10,20 @@ import sys
 def run_web_api():
     """Run the FastAPI web server"""
     import uvicorn
-    from web_api import app
+    from web_api import WS_COMPRESS
     
     port = int(os.environ.get("PORT", 10000))
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    uvicorn.run(
+        "web_api:app",
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
+        ws="websockets",
+        ws_per_message_deflate=WS_COMPRESS,
+        workers=int(os.environ.get("WEB_WORKERS", "1"))
+    )
 
 def run_heist_engine():
     """Run the main heist engine"""
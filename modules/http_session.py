@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+HEIST ENGINE - SHARED HTTP SESSION
+One aiohttp connection pool for every module that calls external APIs.
+
+Modules borrow the session with get_shared_session() and must not close
+it; the process owner (engine shutdown / a module's test main) calls
+close_shared_session() once at exit.
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+import orjson
+
+
+_session: Optional[aiohttp.ClientSession] = None
+_lock = asyncio.Lock()
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get or create the process-wide HTTP session"""
+    global _session
+    async with _lock:
+        if _session is None or _session.closed:
+            _session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300
+                ),
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return _session
+
+
+async def close_shared_session():
+    """Close the shared session (call once, at process shutdown)"""
+    global _session
+    async with _lock:
+        if _session is not None and not _session.closed:
+            await _session.close()
+        _session = None
@@ -3,29 +3,52 @@ THE BRAIN - AI Decision Engine for Heist Engine
 Uses Groq API (Llama 3.1 70B) to make intelligent trading decisions
 """
 import os
-import json
+import mmap
+import time
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 import asyncio
 
+import orjson
+from cachetools import TTLCache
+
 # Import chat system
 try:
-    from chat_system import get_chat_coordinator, AgentType
+    from chat_system import get_chat_coordinator, AgentType, now_iso
     CHAT_AVAILABLE = True
 except ImportError:
     CHAT_AVAILABLE = False
+    
+    def now_iso() -> str:
+        """Local time as an ISO string, truncated to the second (uncached fallback)"""
+        return datetime.fromtimestamp(int(time.time())).isoformat()
 
 try:
-    from groq import AsyncGroq
+    from groq import AsyncGroq, APIConnectionError, InternalServerError, RateLimitError
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
     print("⚠️  WARNING: groq package not installed. AI features disabled.")
     print("   Install with: pip install groq")
 
+# Optional aiohttp transport for Groq (pip install "groq[aiohttp]")
+try:
+    import aiohttp
+    from groq import DefaultAioHttpClient
+    from httpx_aiohttp import AiohttpTransport
+    AIOHTTP_TRANSPORT_AVAILABLE = True
+except ImportError:
+    AIOHTTP_TRANSPORT_AVAILABLE = False
+
 
-@dataclass
+# Market context fields forwarded to the prompt (everything else is dropped)
+_MARKET_KEYS = ("btc_dominance", "eth_price", "fear_greed", "spy_trend")
+
+
+@dataclass(slots=True)
 class AIDecision:
     """AI trading decision"""
     action: str  # "BUY", "SKIP", "WAIT"
@@ -40,16 +63,66 @@ class AIDecision:
 
 
 class TradingMemory:
-    """Stores and retrieves past trading decisions and outcomes"""
+    """
+    Stores and retrieves past trading decisions and outcomes
+    
+    When a journal path is given, every entry is appended to an NDJSON file
+    and replayed on startup. A background task (started with the first
+    decision) flushes and fsyncs new entries every FLUSH_INTERVAL in a
+    worker thread, so disk I/O never blocks the event loop.
+    """
     
-    def __init__(self, max_history: int = 1000):
+    FLUSH_INTERVAL = 1.0  # seconds between journal fsyncs
+    
+    def __init__(self, max_history: int = 1000, path: Optional[str] = None):
         self.max_history = max_history
         self.history: List[Dict] = []
         
+        # Append-only journal
+        self.path = path
+        self._journal = None
+        self._dirty = False  # entries written since the last flush
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_stop: Optional[asyncio.Event] = None
+        
+        if path:
+            self._open_journal(Path(path))
+    
+    def _open_journal(self, journal_path: Path):
+        """Replay an existing journal and open it for appending"""
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        torn_tail = False
+        if journal_path.exists() and journal_path.stat().st_size > 0:
+            self.history = self._replay(journal_path)
+            with open(journal_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                torn_tail = f.read(1) != b'\n'
+        
+        self._journal = open(journal_path, 'ab', buffering=1 << 20)
+        
+        # Terminate a partial last line so new entries start on a fresh line
+        if torn_tail:
+            self._journal.write(b'\n')
+    
+    def _replay(self, journal_path: Path) -> List[Dict]:
+        """Load the most recent entries from the journal"""
+        recent = deque(maxlen=self.max_history)
+        
+        with open(journal_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    try:
+                        recent.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        continue  # Partial line from an interrupted write
+        
+        return list(recent)
+    
     def add_decision(self, signal: Dict, decision: AIDecision, outcome: Optional[Dict] = None):
         """Store a decision and its outcome"""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "signal": signal,
             "decision": {
                 "action": decision.action,
@@ -65,6 +138,55 @@ class TradingMemory:
         # Keep only recent history
         if len(self.history) > self.max_history:
             self.history = self.history[-self.max_history:]
+        
+        if self._journal:
+            self._journal.write(orjson.dumps(entry, default=str) + b'\n')
+            self._dirty = True
+            
+            if self._flush_task is None:
+                self._start_flusher()
+    
+    def _start_flusher(self):
+        """Start the periodic journal flush on the running loop"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (synchronous use): blocking here is harmless
+            self.flush()
+            return
+        
+        self._flush_stop = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        """Flush new journal entries every FLUSH_INTERVAL until stopped"""
+        while not self._flush_stop.is_set():
+            try:
+                await asyncio.wait_for(self._flush_stop.wait(), timeout=self.FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            
+            if self._dirty:
+                await asyncio.to_thread(self.flush)
+    
+    def flush(self):
+        """Write buffered journal entries to disk (blocking)"""
+        if self._journal:
+            self._dirty = False
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+    
+    async def close(self):
+        """Stop the periodic flush, then flush and close the journal"""
+        if self._flush_task is not None:
+            self._flush_stop.set()
+            await self._flush_task  # lets an in-flight flush finish
+            self._flush_task = None
+        
+        if self._journal:
+            await asyncio.to_thread(self.flush)
+            self._journal.close()
+            self._journal = None
     
     def get_similar_signals(self, token_symbol: str, limit: int = 5) -> List[Dict]:
         """Get past decisions for similar tokens"""
@@ -84,9 +206,71 @@ class TradingMemory:
         return wins / len(completed) if completed else 0.0
 
 
+class RateLimiter:
+    """
+    Sliding-window request and token budget shared by all Groq callers
+    
+    Callers queue on a single lock, so concurrent signals share one budget
+    instead of each discovering the limit through its own 429.
+    """
+    
+    WINDOW = 60.0  # seconds
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        
+        self._events: deque = deque()  # (monotonic time, tokens) per request in window
+        self._tokens_in_window = 0
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def _expire(self, now: float):
+        """Forget requests that have left the window"""
+        while self._events and now - self._events[0][0] >= self.WINDOW:
+            _, tokens = self._events.popleft()
+            self._tokens_in_window -= tokens
+    
+    def _delay(self, now: float, tokens: int) -> float:
+        """Seconds to wait before a request of this size fits the budget"""
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        
+        if not self._events:
+            return 0.0
+        
+        over_requests = len(self._events) >= self.requests_per_minute
+        over_tokens = self._tokens_in_window + tokens > self.tokens_per_minute
+        if over_requests or over_tokens:
+            return self._events[0][0] + self.WINDOW - now
+        
+        return 0.0
+    
+    async def acquire(self, tokens: int):
+        """Wait until the request fits the budget, then record it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                
+                delay = self._delay(now, tokens)
+                if delay <= 0:
+                    self._events.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+                
+                await asyncio.sleep(delay)
+    
+    def penalize(self, seconds: float):
+        """Block all callers for a while (e.g. after a 429 with Retry-After)"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
 class TheBrain:
     """AI-Powered Trading Decision Engine"""
     
+    MAX_API_ATTEMPTS = 3  # Retries apply to 5xx and timeouts only
+    
     def __init__(self, logger=None):
         self.logger = logger or self._setup_logger()
         
@@ -94,19 +278,37 @@ class TheBrain:
         self.groq_api_key = os.getenv("GROQ_API_KEY")
         self.enabled = GROQ_AVAILABLE and bool(self.groq_api_key)
         
+        # Groq client is created lazily on the running loop (see _ensure_client)
+        self.client = None
+        
         if self.enabled:
-            self.client = AsyncGroq(api_key=self.groq_api_key)
             self.model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
             self.logger.info(f"🧠 The Brain initialized with {self.model}")
         else:
             self.logger.warning("🧠 The Brain disabled - missing Groq API key or package")
         
-        # Memory system
-        self.memory = TradingMemory()
+        # Memory system (persisted to an NDJSON journal unless AI_MEMORY_PATH is
+        # empty; a disabled Brain records nothing, so it gets no journal)
+        self.memory = TradingMemory(
+            path=(os.getenv("AI_MEMORY_PATH", "./data/trading_memory.ndjson") or None)
+            if self.enabled else None
+        )
+        
+        # Recent decisions, so bursts of signals for one contract reuse a single AI call
+        self.decision_cache: TTLCache = TTLCache(
+            maxsize=2048,
+            ttl=float(os.getenv("AI_DECISION_CACHE_TTL", "60"))
+        )
         
         # Chat system
         self.chat = get_chat_coordinator(logger=self.logger) if CHAT_AVAILABLE else None
         
+        # Shared Groq rate limit
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30")),
+            tokens_per_minute=int(os.getenv("GROQ_TOKENS_PER_MINUTE", "6000"))
+        )
+        
         # Configuration
         self.min_confidence = float(os.getenv("AI_MIN_CONFIDENCE", "0.70"))
         self.max_position_size = float(os.getenv("AI_MAX_POSITION", "0.10"))  # 10% max
@@ -118,6 +320,83 @@ class TheBrain:
         logger.setLevel(logging.INFO)
         return logger
     
+    async def _ensure_client(self):
+        """
+        Get the shared Groq client, creating it on first use
+        
+        Built inside the running event loop so one aiohttp connection pool
+        owns the keep-alive sockets reused by every request.
+        """
+        if self.client is None:
+            http_client = None
+            if AIOHTTP_TRANSPORT_AVAILABLE:
+                http_client = DefaultAioHttpClient(
+                    transport=AiohttpTransport(client=self._create_http_session)
+                )
+            # Retries are handled by _create_completion so they respect the rate limiter
+            self.client = AsyncGroq(
+                api_key=self.groq_api_key,
+                http_client=http_client,
+                max_retries=0
+            )
+        return self.client
+    
+    @staticmethod
+    def _create_http_session():
+        """aiohttp session backing the Groq client"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                keepalive_timeout=300,
+                ttl_dns_cache=300
+            )
+        )
+    
+    async def _create_completion(self, messages: List[Dict], temperature: float, max_tokens: int):
+        """
+        Call Groq chat completions within the shared rate limit
+        
+        A 429 blocks all callers for the server's Retry-After and is re-raised;
+        5xx errors and timeouts are retried with exponential backoff.
+        """
+        client = await self._ensure_client()
+        estimated_tokens = sum(len(m["content"]) for m in messages) // 4 + max_tokens
+        
+        for attempt in range(self.MAX_API_ATTEMPTS):
+            await self.rate_limiter.acquire(estimated_tokens)
+            try:
+                return await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+            except RateLimitError as e:
+                self.rate_limiter.penalize(self._retry_after(e))
+                raise
+            except (InternalServerError, APIConnectionError) as e:
+                if attempt == self.MAX_API_ATTEMPTS - 1:
+                    raise
+                backoff = 0.5 * 2 ** attempt
+                self.logger.warning(f"🧠 Groq request failed ({e}), retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+    
+    @staticmethod
+    def _retry_after(error) -> float:
+        """Seconds to back off after a 429, from the Retry-After header"""
+        try:
+            return float(error.response.headers.get("retry-after", 5))
+        except (AttributeError, TypeError, ValueError):
+            return 5.0
+    
+    async def close(self):
+        """Close the Groq client and flush the decision journal"""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        
+        await self.memory.close()
+    
     async def analyze_signal(
         self, 
         signal: Dict, 
@@ -139,6 +418,14 @@ class TheBrain:
             # Fallback to algorithm-based decision
             return self._fallback_decision(signal, audit)
         
+        # Reuse a recent decision for the same contract with near-identical inputs
+        cache_key = self._decision_cache_key(signal, audit)
+        if cache_key is not None:
+            cached = self.decision_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"🧠 Reusing cached decision for {signal.get('contract_address')}: {cached.action}")
+                return cached
+        
         try:
             # Announce to chat that we're analyzing
             token = signal.get('token_symbol', 'Unknown')
@@ -152,8 +439,7 @@ class TheBrain:
             prompt = self._build_prompt(signal, audit, market_context)
             
             # Get AI decision
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
                 messages=[
                     {
                         "role": "system",
@@ -172,6 +458,9 @@ class TheBrain:
             ai_text = response.choices[0].message.content
             decision = self._parse_ai_response(ai_text)
             
+            if cache_key is not None:
+                self.decision_cache[cache_key] = decision
+            
             # Broadcast decision to chat
             if self.chat:
                 await self.chat.agent_message(
@@ -202,6 +491,26 @@ class TheBrain:
                 )
             return self._fallback_decision(signal, audit)
     
+    @staticmethod
+    def _decision_cache_key(signal: Dict, audit: Dict) -> Optional[tuple]:
+        """Fingerprint of the inputs that drive a decision (None if uncacheable)"""
+        contract_address = signal.get('contract_address')
+        if not contract_address:
+            return None
+        
+        return (
+            contract_address,
+            round(signal.get('hype_score', 0) / 5),
+            int(audit.get('safety_score', 0) // 5),
+            audit.get('is_safe', False)
+        )
+    
+    def _invalidate_decisions(self, contract_address: Optional[str]):
+        """Drop cached decisions for a contract"""
+        stale = [key for key in self.decision_cache if key[0] == contract_address]
+        for key in stale:
+            self.decision_cache.pop(key, None)
+    
     def _get_system_prompt(self) -> str:
         """System prompt that defines the AI's role"""
         success_rate = self.memory.get_success_rate()
@@ -240,6 +549,9 @@ Be conservative - only recommend BUY for high-conviction opportunities."""
             wins = sum(1 for s in similar if s.get("outcome", {}).get("pnl", 0) > 0)
             past_performance = f"\n**Past Performance for {signal.get('token_symbol')}:** {wins}/{len(similar)} wins"
         
+        # Project market context onto the fields the model actually uses
+        market = {k: market_context[k] for k in _MARKET_KEYS if k in market_context} if market_context else {}
+        
         prompt = f"""Analyze this trading signal:
 
 **SIGNAL DATA:**
@@ -259,7 +571,7 @@ Be conservative - only recommend BUY for high-conviction opportunities."""
 {past_performance}
 
 **MARKET CONTEXT:**
-{json.dumps(market_context, indent=2) if market_context else 'Not available'}
+{orjson.dumps(market).decode() if market else 'Not available'}
 
 Should we trade this signal?"""
         
@@ -339,6 +651,7 @@ Should we trade this signal?"""
     ):
         """Store trade outcome for learning"""
         self.memory.add_decision(signal, decision, outcome)
+        self._invalidate_decisions(signal.get('contract_address'))
         
         pnl = outcome.get("pnl", 0)
         result = "WIN" if pnl > 0 else "LOSS"
@@ -363,8 +676,7 @@ Should we trade this signal?"""
         
         try:
             # Call Groq API for chat
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
                 messages=[
                     {
                         "role": "system",
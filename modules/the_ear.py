@@ -12,12 +12,14 @@ Project: Operation First Blood
 
 import asyncio
 import re
+import time
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 import json
+import orjson
 
 # External imports (will be installed via requirements.txt)
 try:
@@ -141,11 +143,15 @@ class EarConfig:
     SOLANA_ADDRESS_PATTERN = r'[1-9A-HJ-NP-Za-km-z]{32,44}'
 
 
+# Emoji heuristic: any codepoint above 127000 (U+1F018)
+EMOJI_PATTERN = re.compile('[\U0001F019-\U0010FFFF]')
+
+
 # ============================================
 # DATA STRUCTURES
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class TokenSignal:
     """Represents a detected token signal"""
     token_symbol: Optional[str] = None
@@ -157,6 +163,8 @@ class TokenSignal:
     timestamp: datetime = field(default_factory=datetime.now)
     hype_score: float = 0.0
     raw_data: Dict = field(default_factory=dict)
+    # Signals never change after detection; encoded once for the API
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -170,18 +178,32 @@ class TokenSignal:
             'timestamp': self.timestamp.isoformat(),
             'hype_score': self.hype_score,
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """to_dict() encoded as JSON (cached)"""
+        if self._json is None:
+            self._json = orjson.dumps(self.to_dict())
+        return self._json
 
 
-@dataclass
+@dataclass(slots=True)
 class HypeMetrics:
     """Tracks hype metrics for a token over time"""
     contract_address: str
     message_count: int = 0
     total_hype_score: float = 0.0
     first_seen: datetime = field(default_factory=datetime.now)
-    last_seen: datetime = field(default_factory=datetime.now)
     sources: Set[str] = field(default_factory=set)
     
+    # Monotonic clock readings used for interval math on the message path
+    first_seen_mono: float = field(default_factory=time.monotonic)
+    last_seen_mono: float = field(default_factory=time.monotonic)
+    
+    @property
+    def last_seen(self) -> datetime:
+        """Wall-clock time of the latest message (for display)"""
+        return self.first_seen + timedelta(seconds=self.last_seen_mono - self.first_seen_mono)
+    
     @property
     def average_hype_score(self) -> float:
         """Calculate average hype score"""
@@ -190,7 +212,7 @@ class HypeMetrics:
     @property
     def velocity(self) -> float:
         """Calculate message velocity (messages per minute)"""
-        time_diff = (self.last_seen - self.first_seen).total_seconds() / 60
+        time_diff = (self.last_seen_mono - self.first_seen_mono) / 60
         return self.message_count / time_diff if time_diff > 0 else 0.0
 
 
@@ -210,6 +232,12 @@ class TheEar:
         self.logger = logging.getLogger('TheEar')
         self.config = EarConfig()
         
+        # Keywords lowercased once so scoring does no per-call keyword work
+        self._hype_keywords = tuple(
+            (keyword.lower(), weight)
+            for keyword, weight in self.config.HYPE_KEYWORDS.items()
+        )
+        
         # Tracking structures
         self.token_metrics: Dict[str, HypeMetrics] = {}
         self.recent_signals: List[TokenSignal] = []
@@ -375,7 +403,13 @@ class TheEar:
             self.logger.error(f"Error processing Discord message: {e}")
     
     async def _extract_signal(self, text: str, platform: str, channel: str, message_id: str) -> Optional[TokenSignal]:
-        """Extract token signal from message text"""
+        """Extract token signal from message text (off the event loop)"""
+        return await asyncio.to_thread(
+            self._extract_signal_sync, text, platform, channel, message_id
+        )
+    
+    def _extract_signal_sync(self, text: str, platform: str, channel: str, message_id: str) -> Optional[TokenSignal]:
+        """Extract token signal from message text (pure, thread-safe)"""
         
         # Calculate hype score
         hype_score = self._calculate_hype_score(text)
@@ -412,24 +446,21 @@ class TheEar:
     
     def _calculate_hype_score(self, text: str) -> float:
         """Calculate hype score based on keywords and patterns"""
-        score = 0.0
         text_lower = text.lower()
         
         # Check for hype keywords
-        for keyword, weight in self.config.HYPE_KEYWORDS.items():
-            if keyword.lower() in text_lower:
-                score += weight
+        score = float(sum(weight for keyword, weight in self._hype_keywords if keyword in text_lower))
         
         # Bonus for multiple exclamation marks
         exclamation_count = text.count('!')
         score += min(exclamation_count * 2, 10)
         
-        # Bonus for emojis (simple heuristic)
-        emoji_count = sum(1 for char in text if ord(char) > 127000)
+        # Bonus for emojis (simple heuristic, counted by the regex engine)
+        emoji_count = len(EMOJI_PATTERN.findall(text))
         score += min(emoji_count, 5)
         
         # Bonus for ALL CAPS words
-        caps_words = sum(1 for word in text.split() if word.isupper() and len(word) > 2)
+        caps_words = sum(1 for word in text.split() if len(word) > 2 and word.isupper())
         score += min(caps_words * 3, 15)
         
         return score
@@ -448,7 +479,7 @@ class TheEar:
             metrics = self.token_metrics[signal.contract_address]
             metrics.message_count += 1
             metrics.total_hype_score += signal.hype_score
-            metrics.last_seen = datetime.now()
+            metrics.last_seen_mono = time.monotonic()
             metrics.sources.add(f"{signal.source_platform}:{signal.source_channel}")
         
         # Log the signal
@@ -511,10 +542,11 @@ class TheEar:
         ]
         
         # Remove old metrics
+        cutoff_mono = time.monotonic() - 24 * 3600
         self.token_metrics = {
             addr: metrics 
             for addr, metrics in self.token_metrics.items()
-            if metrics.last_seen > cutoff_time
+            if metrics.last_seen_mono > cutoff_mono
         }
     
     def get_top_signals(self, limit: int = 10) -> List[TokenSignal]:
@@ -11,31 +11,30 @@ Project: Operation First Blood
 """
 
 import asyncio
+import bisect
+import functools
 import logging
+import random
+import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import json
 
 # External imports
 try:
     from web3 import Web3
-    from web3.contract import Contract
 except ImportError:
     Web3 = None
 
-try:
-    from solana.rpc.async_api import AsyncClient as SolanaClient
-    from solders.pubkey import Pubkey
-except ImportError:
-    SolanaClient = None
-
-import requests
 import aiohttp
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 import os
 
+from modules.http_session import get_shared_session, close_shared_session
+
 # Load environment variables
 load_dotenv()
 
@@ -62,6 +61,14 @@ class EyeConfig:
     MAX_BUY_TAX = float(os.getenv('MAX_BUY_TAX', '10.0'))
     MAX_SELL_TAX = float(os.getenv('MAX_SELL_TAX', '10.0'))
     
+    # Audit cache
+    AUDIT_CACHE_SIZE = int(os.getenv('AUDIT_CACHE_SIZE', '1024'))
+    AUDIT_CACHE_TTL_SECONDS = int(os.getenv('AUDIT_CACHE_TTL_SECONDS', '300'))
+    ETAG_CACHE_TTL_SECONDS = int(os.getenv('ETAG_CACHE_TTL_SECONDS', '3600'))
+    
+    # HTTP client
+    API_TIMEOUT_SECONDS = float(os.getenv('AUDIT_API_TIMEOUT_SECONDS', '8'))
+    
     # API endpoints
     HONEYPOT_API_URL = 'https://api.honeypot.is/v2/IsHoneypot'
     RUGCHECK_API_URL = 'https://api.rugcheck.xyz/v1/tokens'
@@ -84,7 +91,42 @@ class RiskLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+# Safety score → risk level table (score >= threshold moves up one level)
+_RISK_THRESHOLDS = (30, 50, 70, 90)
+_RISK_LEVELS = (RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW, RiskLevel.SAFE)
+
+# RugCheck risk level → severity
+_SEVERITY_MAP = {
+    'low': RiskLevel.LOW,
+    'medium': RiskLevel.MEDIUM,
+    'high': RiskLevel.HIGH,
+    'critical': RiskLevel.CRITICAL
+}
+
+
+# Address validation / EIP-55 checksums (keccak per call) memoized per address
+@functools.lru_cache(maxsize=4096)
+def _is_address(address: str) -> bool:
+    return Web3.is_address(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    return Web3.to_checksum_address(address)
+
+
+# solana-py is a large import only Solana audits need; load it on first use
+@functools.lru_cache(maxsize=None)
+def _lazy_solana():
+    """Return solana-py's AsyncClient class, or None if not installed"""
+    try:
+        from solana.rpc.async_api import AsyncClient
+    except ImportError:
+        return None
+    return AsyncClient
+
+
+@dataclass(slots=True)
 class SecurityCheck:
     """Individual security check result"""
     name: str
@@ -92,9 +134,24 @@ class SecurityCheck:
     score: float  # 0-100
     details: str
     severity: RiskLevel = RiskLevel.LOW
+    
+    # Serialized form, built on first to_dict() (checks are not mutated once recorded)
+    _dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        if self._dict is None:
+            self._dict = {
+                'name': self.name,
+                'passed': self.passed,
+                'score': self.score,
+                'details': self.details,
+                'severity': self.severity.value
+            }
+        return self._dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractAudit:
     """Complete audit result for a token contract"""
     contract_address: str
@@ -106,7 +163,7 @@ class ContractAudit:
     safety_score: float = 0.0  # 0-100
     risk_level: RiskLevel = RiskLevel.CRITICAL
     
-    # Individual checks
+    # Individual checks (record via add_check to keep aggregates in sync)
     checks: List[SecurityCheck] = field(default_factory=list)
     
     # Contract details
@@ -131,6 +188,17 @@ class ContractAudit:
     # Additional data
     raw_data: Dict = field(default_factory=dict)
     
+    # Running aggregates over checks, maintained by add_check()
+    score_total: float = field(default=0.0, init=False, repr=False)
+    critical_failures: int = field(default=0, init=False, repr=False)
+    
+    def add_check(self, check: SecurityCheck):
+        """Record a check and update the running score aggregates"""
+        self.checks.append(check)
+        self.score_total += check.score
+        if not check.passed and check.severity == RiskLevel.CRITICAL:
+            self.critical_failures += 1
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -149,17 +217,12 @@ class ContractAudit:
             'holder_count': self.holder_count,
             'buy_tax': self.buy_tax,
             'sell_tax': self.sell_tax,
-            'checks': [
-                {
-                    'name': check.name,
-                    'passed': check.passed,
-                    'score': check.score,
-                    'details': check.details,
-                    'severity': check.severity.value
-                }
-                for check in self.checks
-            ]
+            'checks': [check.to_dict() for check in self.checks]
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return orjson.dumps(self.to_dict())
 
 
 # ============================================
@@ -180,13 +243,36 @@ class TheEye:
         
         # Blockchain clients
         self.eth_web3: Optional[Web3] = None
-        self.solana_client: Optional[SolanaClient] = None
+        self.solana_client = None  # solana AsyncClient, created on first Solana audit
+        self._solana_unavailable = False  # set once import/connect has failed
         
         # HTTP session for API calls
         self.session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=self.config.API_TIMEOUT_SECONDS)
+        
+        # Cache for recent audits (bounded, entries expire automatically;
+        # expiry runs on the monotonic clock, never datetime.now())
+        self.audit_cache: TTLCache = TTLCache(
+            maxsize=self.config.AUDIT_CACHE_SIZE,
+            ttl=self.config.AUDIT_CACHE_TTL_SECONDS,
+            timer=time.monotonic
+        )
         
-        # Cache for recent audits
-        self.audit_cache: Dict[str, ContractAudit] = {}
+        # Last validator + parsed body per (api, address) for conditional GETs
+        self._etag_cache: TTLCache = TTLCache(
+            maxsize=self.config.AUDIT_CACHE_SIZE,
+            ttl=self.config.ETAG_CACHE_TTL_SECONDS,
+            timer=time.monotonic
+        )
+        
+        # Private generator for simulation mode
+        self._rng = random.Random()
+        
+        # Chain analyzers, keyed by lowercase chain name
+        self._auditors = {
+            'ethereum': self._audit_ethereum_contract,
+            'solana': self._audit_solana_contract,
+        }
         
     # ============================================
     # INITIALIZATION
@@ -209,25 +295,14 @@ class TheEye:
         else:
             self.logger.warning("⚠️ web3.py not installed, Ethereum analysis disabled")
         
-        # Initialize Solana client
-        if SolanaClient:
-            try:
-                self.solana_client = SolanaClient(self.config.SOLANA_RPC_URL)
-                self.logger.info(f"✅ Connected to Solana: {self.config.SOLANA_RPC_URL}")
-            except Exception as e:
-                self.logger.error(f"❌ Solana initialization error: {e}")
-        else:
-            self.logger.warning("⚠️ solana-py not installed, Solana analysis disabled")
-        
-        # Initialize HTTP session
-        self.session = aiohttp.ClientSession()
+        # Borrow the engine-wide HTTP session (keep-alive pool, DNS cache)
+        self.session = await get_shared_session()
         
         self.logger.info("✅ The Eye is ready to analyze")
     
     async def shutdown(self):
-        """Clean shutdown"""
-        if self.session:
-            await self.session.close()
+        """Clean shutdown (the shared HTTP session is closed by its owner)"""
+        self.session = None
         
         if self.solana_client:
             await self.solana_client.close()
@@ -257,12 +332,10 @@ class TheEye:
         
         # Check cache first
         cache_key = f"{chain}:{contract_address}"
-        if cache_key in self.audit_cache:
-            cached = self.audit_cache[cache_key]
-            age = (datetime.now() - cached.timestamp).total_seconds()
-            if age < 300:  # 5 minute cache
-                self.logger.info("📋 Returning cached audit")
-                return cached
+        cached = self.audit_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("📋 Returning cached audit")
+            return cached
         
         # Create audit object
         audit = ContractAudit(
@@ -272,13 +345,11 @@ class TheEye:
         
         try:
             # Route to appropriate chain analyzer
-            if chain.lower() == 'ethereum':
-                await self._audit_ethereum_contract(audit)
-            elif chain.lower() == 'solana':
-                await self._audit_solana_contract(audit)
-            else:
+            auditor = self._auditors.get(chain.lower())
+            if auditor is None:
                 self.logger.error(f"❌ Unsupported chain: {chain}")
                 return audit
+            await auditor(audit)
             
             # Calculate overall safety score
             self._calculate_safety_score(audit)
@@ -298,7 +369,7 @@ class TheEye:
             
         except Exception as e:
             self.logger.error(f"❌ Audit failed: {e}")
-            audit.checks.append(SecurityCheck(
+            audit.add_check(SecurityCheck(
                 name="Audit Error",
                 passed=False,
                 score=0,
@@ -309,24 +380,24 @@ class TheEye:
     
     async def _simulate_audit(self, contract_address: str, chain: str) -> ContractAudit:
         """Simulate a contract audit"""
-        import random
+        rng = self._rng
         
         # 80% chance to be safe
-        is_safe = random.random() < 0.8
+        is_safe = rng.random() < 0.8
         
         audit = ContractAudit(
             contract_address=contract_address,
             chain=chain,
             is_safe=is_safe,
-            safety_score=random.uniform(85, 99) if is_safe else random.uniform(10, 60),
+            safety_score=rng.uniform(85, 99) if is_safe else rng.uniform(10, 60),
             risk_level=RiskLevel.SAFE if is_safe else RiskLevel.HIGH,
             token_symbol="SIM",
-            liquidity_usd=random.uniform(50000, 500000),
+            liquidity_usd=rng.uniform(50000, 500000),
             buy_tax=0 if is_safe else 20,
             sell_tax=0 if is_safe else 20
         )
         
-        audit.checks.append(SecurityCheck(
+        audit.add_check(SecurityCheck(
             name="Simulation Check",
             passed=is_safe,
             score=audit.safety_score,
@@ -349,8 +420,9 @@ class TheEye:
     async def _audit_ethereum_contract(self, audit: ContractAudit):
         """Perform Ethereum-specific contract analysis"""
         
-        if not self.eth_web3 or not self.eth_web3.is_connected():
-            audit.checks.append(SecurityCheck(
+        loop = asyncio.get_running_loop()
+        if not self.eth_web3 or not await loop.run_in_executor(None, self.eth_web3.is_connected):
+            audit.add_check(SecurityCheck(
                 name="Ethereum Connection",
                 passed=False,
                 score=0,
@@ -360,8 +432,8 @@ class TheEye:
             return
         
         # Check if address is valid
-        if not Web3.is_address(audit.contract_address):
-            audit.checks.append(SecurityCheck(
+        if not _is_address(audit.contract_address):
+            audit.add_check(SecurityCheck(
                 name="Address Validation",
                 passed=False,
                 score=0,
@@ -371,36 +443,88 @@ class TheEye:
             return
         
         # Normalize address
-        address = Web3.to_checksum_address(audit.contract_address)
+        address = _checksum(audit.contract_address)
+        
+        # 1. Gate: contract existence (sync web3 RPC, run in the default
+        #    executor) concurrently with Honeypot.is (comprehensive check)
+        code, honeypot = await asyncio.gather(
+            loop.run_in_executor(None, self.eth_web3.eth.get_code, address),
+            self._check_honeypot_api(audit, address),
+            return_exceptions=True
+        )
+        self._record_check_errors(audit, ("Honeypot API",), (honeypot,))
         
-        # 1. Check if contract exists
-        code = self.eth_web3.eth.get_code(address)
-        if code == b'' or code == b'0x':
-            audit.checks.append(SecurityCheck(
-                name="Contract Existence",
-                passed=False,
-                score=0,
-                details="No contract code at this address",
-                severity=RiskLevel.CRITICAL
-            ))
-            return
-        else:
-            audit.checks.append(SecurityCheck(
+        if isinstance(code, Exception):
+            raise code
+        
+        has_code = not (code == b'' or code == b'0x')
+        if has_code:
+            audit.add_check(SecurityCheck(
                 name="Contract Existence",
                 passed=True,
                 score=100,
                 details="Contract code verified",
                 severity=RiskLevel.LOW
             ))
+        else:
+            audit.add_check(SecurityCheck(
+                name="Contract Existence",
+                passed=False,
+                score=0,
+                details="No contract code at this address",
+                severity=RiskLevel.CRITICAL
+            ))
         
-        # 2. Use Honeypot.is API for comprehensive check
-        await self._check_honeypot_api(audit, address)
+        # A missing contract or a confirmed honeypot is already a critical
+        # failure; nothing further can make it safe, so save the API quota
+        if not has_code or (audit.is_honeypot and 'honeypot_api' in audit.raw_data):
+            return
         
-        # 3. Use DEXTools API for additional data
-        await self._check_dextools_api(audit, address)
+        # 2. Remaining independent checks:
+        #    DEXTools (additional data), contract age (newer = riskier)
+        results = await asyncio.gather(
+            self._check_dextools_api(audit, address),
+            self._check_contract_age(audit, address),
+            return_exceptions=True
+        )
+        self._record_check_errors(audit, ("DEXTools API", "Contract Age"), results)
+    
+    def _record_check_errors(self, audit: ContractAudit, names: Tuple[str, ...], results):
+        """Turn exceptions returned by asyncio.gather into MEDIUM checks"""
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                audit.add_check(SecurityCheck(
+                    name=name,
+                    passed=False,
+                    score=50,
+                    details=f"Check error: {result}",
+                    severity=RiskLevel.MEDIUM
+                ))
+    
+    async def _get_json_revalidated(self, api: str, address: str, url: str, **kwargs) -> Optional[Dict]:
+        """
+        GET a JSON API response, revalidating with If-None-Match
         
-        # 4. Check contract age (newer = riskier)
-        await self._check_contract_age(audit, address)
+        A 304 reuses the body cached with the ETag; any other non-200
+        status returns None.
+        """
+        key = (api, address)
+        cached = self._etag_cache.get(key)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+        
+        async with self.session.get(url, headers=headers, timeout=self._timeout, **kwargs) as response:
+            if response.status == 304 and cached is not None:
+                return cached[1]
+            if response.status != 200:
+                return None
+            
+            data = orjson.loads(await response.read())
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[key] = (etag, data)
+            return data
     
     async def _check_honeypot_api(self, audit: ContractAudit, address: str):
         """Check contract using Honeypot.is API"""
@@ -410,56 +534,56 @@ class TheEye:
                 'chainID': '1',  # Ethereum mainnet
             }
             
-            async with self.session.get(self.config.HONEYPOT_API_URL, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Parse honeypot check
-                    is_honeypot = data.get('honeypotResult', {}).get('isHoneypot', True)
-                    audit.is_honeypot = is_honeypot
-                    
-                    audit.checks.append(SecurityCheck(
-                        name="Honeypot Check",
-                        passed=not is_honeypot,
-                        score=0 if is_honeypot else 100,
-                        details="Not a honeypot" if not is_honeypot else "HONEYPOT DETECTED",
-                        severity=RiskLevel.CRITICAL if is_honeypot else RiskLevel.LOW
-                    ))
-                    
-                    # Parse simulation results
-                    sim = data.get('simulationResult', {})
-                    buy_tax = sim.get('buyTax', 100)
-                    sell_tax = sim.get('sellTax', 100)
-                    
-                    audit.buy_tax = buy_tax
-                    audit.sell_tax = sell_tax
-                    
-                    # Check buy tax
-                    buy_tax_ok = buy_tax <= self.config.MAX_BUY_TAX
-                    audit.checks.append(SecurityCheck(
-                        name="Buy Tax",
-                        passed=buy_tax_ok,
-                        score=100 - min(buy_tax * 5, 100),
-                        details=f"Buy tax: {buy_tax}%",
-                        severity=RiskLevel.HIGH if buy_tax > 20 else RiskLevel.MEDIUM
-                    ))
-                    
-                    # Check sell tax
-                    sell_tax_ok = sell_tax <= self.config.MAX_SELL_TAX
-                    audit.checks.append(SecurityCheck(
-                        name="Sell Tax",
-                        passed=sell_tax_ok,
-                        score=100 - min(sell_tax * 5, 100),
-                        details=f"Sell tax: {sell_tax}%",
-                        severity=RiskLevel.HIGH if sell_tax > 20 else RiskLevel.MEDIUM
-                    ))
-                    
-                    # Store raw data
-                    audit.raw_data['honeypot_api'] = data
-                    
+            data = await self._get_json_revalidated(
+                'honeypot', address, self.config.HONEYPOT_API_URL, params=params
+            )
+            if data is not None:
+                # Parse honeypot check
+                is_honeypot = data.get('honeypotResult', {}).get('isHoneypot', True)
+                audit.is_honeypot = is_honeypot
+                
+                audit.add_check(SecurityCheck(
+                    name="Honeypot Check",
+                    passed=not is_honeypot,
+                    score=0 if is_honeypot else 100,
+                    details="Not a honeypot" if not is_honeypot else "HONEYPOT DETECTED",
+                    severity=RiskLevel.CRITICAL if is_honeypot else RiskLevel.LOW
+                ))
+                
+                # Parse simulation results
+                sim = data.get('simulationResult', {})
+                buy_tax = sim.get('buyTax', 100)
+                sell_tax = sim.get('sellTax', 100)
+                
+                audit.buy_tax = buy_tax
+                audit.sell_tax = sell_tax
+                
+                # Check buy tax
+                buy_tax_ok = buy_tax <= self.config.MAX_BUY_TAX
+                audit.add_check(SecurityCheck(
+                    name="Buy Tax",
+                    passed=buy_tax_ok,
+                    score=100 - min(buy_tax * 5, 100),
+                    details=f"Buy tax: {buy_tax}%",
+                    severity=RiskLevel.HIGH if buy_tax > 20 else RiskLevel.MEDIUM
+                ))
+                
+                # Check sell tax
+                sell_tax_ok = sell_tax <= self.config.MAX_SELL_TAX
+                audit.add_check(SecurityCheck(
+                    name="Sell Tax",
+                    passed=sell_tax_ok,
+                    score=100 - min(sell_tax * 5, 100),
+                    details=f"Sell tax: {sell_tax}%",
+                    severity=RiskLevel.HIGH if sell_tax > 20 else RiskLevel.MEDIUM
+                ))
+                
+                # Store raw data
+                audit.raw_data['honeypot_api'] = data
+                
         except Exception as e:
             self.logger.error(f"Honeypot API error: {e}")
-            audit.checks.append(SecurityCheck(
+            audit.add_check(SecurityCheck(
                 name="Honeypot API",
                 passed=False,
                 score=50,
@@ -476,32 +600,30 @@ class TheEye:
             headers = {'X-API-Key': self.config.DEXTOOLS_API_KEY}
             url = f"{self.config.DEXTOOLS_API_URL}/ether/{address}"
             
-            async with self.session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
+            data = await self._get_json_revalidated('dextools', address, url, headers=headers)
+            if data is not None:
+                # Extract token info
+                if 'data' in data:
+                    token_data = data['data']
+                    audit.token_name = token_data.get('name')
+                    audit.token_symbol = token_data.get('symbol')
+                    audit.total_supply = token_data.get('totalSupply')
+                    
+                    # Liquidity check
+                    liquidity = token_data.get('liquidity', {}).get('usd', 0)
+                    audit.liquidity_usd = liquidity
+                    
+                    liquidity_ok = liquidity >= self.config.MIN_LIQUIDITY_USD
+                    audit.add_check(SecurityCheck(
+                        name="Liquidity",
+                        passed=liquidity_ok,
+                        score=min(liquidity / 1000, 100),
+                        details=f"${liquidity:,.2f} liquidity",
+                        severity=RiskLevel.HIGH if not liquidity_ok else RiskLevel.LOW
+                    ))
+                    
+                    audit.raw_data['dextools_api'] = data
                     
-                    # Extract token info
-                    if 'data' in data:
-                        token_data = data['data']
-                        audit.token_name = token_data.get('name')
-                        audit.token_symbol = token_data.get('symbol')
-                        audit.total_supply = token_data.get('totalSupply')
-                        
-                        # Liquidity check
-                        liquidity = token_data.get('liquidity', {}).get('usd', 0)
-                        audit.liquidity_usd = liquidity
-                        
-                        liquidity_ok = liquidity >= self.config.MIN_LIQUIDITY_USD
-                        audit.checks.append(SecurityCheck(
-                            name="Liquidity",
-                            passed=liquidity_ok,
-                            score=min(liquidity / 1000, 100),
-                            details=f"${liquidity:,.2f} liquidity",
-                            severity=RiskLevel.HIGH if not liquidity_ok else RiskLevel.LOW
-                        ))
-                        
-                        audit.raw_data['dextools_api'] = data
-                        
         except Exception as e:
             self.logger.error(f"DEXTools API error: {e}")
     
@@ -518,11 +640,30 @@ class TheEye:
     # SOLANA ANALYSIS
     # ============================================
     
+    def _ensure_solana_client(self):
+        """Create the Solana client on first use (imports solana-py lazily)"""
+        if self.solana_client is not None or self._solana_unavailable:
+            return self.solana_client
+        
+        SolanaClient = _lazy_solana()
+        if SolanaClient is None:
+            self.logger.warning("⚠️ solana-py not installed, Solana analysis disabled")
+            self._solana_unavailable = True
+            return None
+        
+        try:
+            self.solana_client = SolanaClient(self.config.SOLANA_RPC_URL)
+            self.logger.info(f"✅ Connected to Solana: {self.config.SOLANA_RPC_URL}")
+        except Exception as e:
+            self.logger.error(f"❌ Solana initialization error: {e}")
+            self._solana_unavailable = True
+        return self.solana_client
+    
     async def _audit_solana_contract(self, audit: ContractAudit):
         """Perform Solana-specific contract analysis"""
         
-        if not self.solana_client:
-            audit.checks.append(SecurityCheck(
+        if not self._ensure_solana_client():
+            audit.add_check(SecurityCheck(
                 name="Solana Connection",
                 passed=False,
                 score=0,
@@ -537,7 +678,7 @@ class TheEye:
             
         except Exception as e:
             self.logger.error(f"Solana audit error: {e}")
-            audit.checks.append(SecurityCheck(
+            audit.add_check(SecurityCheck(
                 name="Solana Audit",
                 passed=False,
                 score=0,
@@ -550,9 +691,9 @@ class TheEye:
         try:
             url = f"{self.config.RUGCHECK_API_URL}/{audit.contract_address}/report"
             
-            async with self.session.get(url) as response:
+            async with self.session.get(url, timeout=self._timeout) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     
                     # Parse RugCheck score
                     score = data.get('score', 0)
@@ -566,7 +707,7 @@ class TheEye:
                     # Overall safety from RugCheck
                     is_safe = score >= 50 and len(risks) == 0
                     
-                    audit.checks.append(SecurityCheck(
+                    audit.add_check(SecurityCheck(
                         name="RugCheck Analysis",
                         passed=is_safe,
                         score=score,
@@ -575,30 +716,23 @@ class TheEye:
                     ))
                     
                     # Check for specific risks
+                    add_check = audit.add_check
+                    severity_for = _SEVERITY_MAP.get
                     for risk in risks:
-                        risk_name = risk.get('name', 'Unknown Risk')
-                        risk_level = risk.get('level', 'medium')
-                        
-                        severity_map = {
-                            'low': RiskLevel.LOW,
-                            'medium': RiskLevel.MEDIUM,
-                            'high': RiskLevel.HIGH,
-                            'critical': RiskLevel.CRITICAL
-                        }
-                        
-                        audit.checks.append(SecurityCheck(
-                            name=risk_name,
+                        risk_get = risk.get
+                        add_check(SecurityCheck(
+                            name=risk_get('name', 'Unknown Risk'),
                             passed=False,
                             score=0,
-                            details=risk.get('description', ''),
-                            severity=severity_map.get(risk_level, RiskLevel.MEDIUM)
+                            details=risk_get('description', ''),
+                            severity=severity_for(risk_get('level', 'medium'), RiskLevel.MEDIUM)
                         ))
                     
                     audit.raw_data['rugcheck_api'] = data
                     
         except Exception as e:
             self.logger.error(f"RugCheck API error: {e}")
-            audit.checks.append(SecurityCheck(
+            audit.add_check(SecurityCheck(
                 name="RugCheck API",
                 passed=False,
                 score=50,
@@ -619,32 +753,16 @@ class TheEye:
             audit.is_safe = False
             return
         
-        # Calculate weighted average of all checks
-        total_score = sum(check.score for check in audit.checks)
-        audit.safety_score = total_score / len(audit.checks)
+        # Average of all checks (running total kept by add_check)
+        audit.safety_score = audit.score_total / len(audit.checks)
         
         # Determine risk level
-        if audit.safety_score >= 90:
-            audit.risk_level = RiskLevel.SAFE
-        elif audit.safety_score >= 70:
-            audit.risk_level = RiskLevel.LOW
-        elif audit.safety_score >= 50:
-            audit.risk_level = RiskLevel.MEDIUM
-        elif audit.safety_score >= 30:
-            audit.risk_level = RiskLevel.HIGH
-        else:
-            audit.risk_level = RiskLevel.CRITICAL
-        
-        # Check critical failures
-        critical_failures = [
-            check for check in audit.checks
-            if not check.passed and check.severity == RiskLevel.CRITICAL
-        ]
+        audit.risk_level = _RISK_LEVELS[bisect.bisect_right(_RISK_THRESHOLDS, audit.safety_score)]
         
         # Determine if safe to trade
         audit.is_safe = (
             audit.safety_score >= self.config.MIN_SAFETY_SCORE
-            and len(critical_failures) == 0
+            and audit.critical_failures == 0
             and not audit.is_honeypot
         )
     
@@ -666,6 +784,31 @@ class TheEye:
         audit = await self.audit_contract(contract_address, chain)
         return audit.is_safe
     
+    async def audit_contracts_bulk(
+        self,
+        contracts: List[Tuple[str, str]],
+        concurrency: int = 16
+    ) -> List[ContractAudit]:
+        """
+        Audit many contracts concurrently
+        
+        Args:
+            contracts: (contract_address, chain) pairs
+            concurrency: Maximum number of audits in flight at once
+            
+        Returns:
+            ContractAudit objects in the same order as contracts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def audit_one(contract_address: str, chain: str) -> ContractAudit:
+            async with semaphore:
+                return await self.audit_contract(contract_address, chain)
+        
+        return list(await asyncio.gather(
+            *(audit_one(address, chain) for address, chain in contracts)
+        ))
+    
     def get_cached_audit(self, contract_address: str, chain: str = 'ethereum') -> Optional[ContractAudit]:
         """Get cached audit if available"""
         cache_key = f"{chain}:{contract_address}"
@@ -704,8 +847,15 @@ async def main():
     print("="*60)
     
     await eye.shutdown()
+    await close_shared_session()
 
 
 if __name__ == '__main__':
+    # Prefer uvloop's libuv event loop; fall back to asyncio's (e.g. on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
 
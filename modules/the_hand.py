@@ -12,12 +12,16 @@ Project: Operation First Blood
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+import random
+import time
+from typing import Deque, Dict, Optional, Tuple
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from decimal import Decimal
 import json
+import orjson
 
 # External imports
 try:
@@ -67,6 +71,7 @@ class HandConfig:
     MAX_SLIPPAGE_PERCENT = float(os.getenv('MAX_SLIPPAGE_PERCENT', '5'))
     MAX_HOLD_TIME_HOURS = int(os.getenv('MAX_HOLD_TIME_HOURS', '24'))
     MAX_POSITIONS = int(os.getenv('MAX_POSITIONS', '5'))
+    CLOSED_HISTORY_CAP = int(os.getenv('CLOSED_HISTORY_CAP', '1000'))  # closed positions kept in memory
     
     # Gas settings
     GAS_PRICE_MULTIPLIER = float(os.getenv('GAS_PRICE_MULTIPLIER', '1.2'))
@@ -97,6 +102,10 @@ class TradeStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
+# Enum → wire value, resolved once instead of via Enum.value per call
+_STATUS_VALUES = {status: status.value for status in TradeStatus}
+
+
 class ExitReason(Enum):
     """Reason for closing a position"""
     PROFIT_TARGET = "PROFIT_TARGET"
@@ -107,7 +116,14 @@ class ExitReason(Enum):
     EMERGENCY = "EMERGENCY"
 
 
-@dataclass
+# Exit reasons returned from the monitor hot path, bound once at import
+_R_PROFIT = ExitReason.PROFIT_TARGET
+_R_STOP = ExitReason.STOP_LOSS
+_R_TRAIL = ExitReason.TRAILING_STOP
+_R_TIME = ExitReason.TIME_LIMIT
+
+
+@dataclass(slots=True)
 class Position:
     """Represents an open trading position"""
     position_id: str
@@ -116,7 +132,8 @@ class Position:
     token_symbol: str
     
     # Entry details
-    entry_time: datetime = field(default_factory=datetime.now)
+    entry_time_ts: float = field(default_factory=time.time)  # epoch seconds
+    entry_mono: float = field(default_factory=time.monotonic, repr=False)  # hold-time clock
     entry_price: float = 0.0
     entry_amount_usd: float = 0.0
     entry_amount_tokens: float = 0.0
@@ -141,21 +158,40 @@ class Position:
     # Status
     status: TradeStatus = TradeStatus.PENDING
     
+    # entry_time never changes once set; format it once for to_dict()
+    _entry_time_iso: str = field(default='', init=False, repr=False, compare=False)
+    # A closed position is final; its to_dict() is built once and reused
+    _closed_dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    _closed_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    # Encoded entry half of to_json_bytes() ('{"position_id":...,'), fixed at open
+    _json_head: bytes = field(default=b'', init=False, repr=False, compare=False)
+    # 1 / entry_amount_usd (0 when unset), fixed at open so each tick multiplies
+    _inv_entry_usd: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._entry_time_iso = self.entry_time.isoformat()
+        self._inv_entry_usd = 1.0 / self.entry_amount_usd if self.entry_amount_usd > 0 else 0.0
+    
+    @property
+    def entry_time(self) -> datetime:
+        """Entry time as a local datetime"""
+        return datetime.fromtimestamp(self.entry_time_ts)
+    
     def update_current_price(self, price: float):
         """Update current price and metrics"""
+        entry_usd = self.entry_amount_usd
+        value = self.entry_amount_tokens * price
         self.current_price = price
-        self.current_value_usd = self.entry_amount_tokens * price
+        self.current_value_usd = value
         
         # Update peak price
         if price > self.peak_price:
             self.peak_price = price
         
         # Calculate P&L
-        self.profit_loss_usd = self.current_value_usd - self.entry_amount_usd
-        self.profit_loss_percent = (
-            (self.current_value_usd / self.entry_amount_usd - 1) * 100
-            if self.entry_amount_usd > 0 else 0
-        )
+        self.profit_loss_usd = value - entry_usd
+        inv_entry = self._inv_entry_usd
+        self.profit_loss_percent = (value * inv_entry - 1.0) * 100.0 if inv_entry else 0
     
     def should_take_profit(self, target_percent: float) -> bool:
         """Check if profit target is reached"""
@@ -173,22 +209,53 @@ class Position:
         drop_from_peak = ((self.peak_price - self.current_price) / self.peak_price) * 100
         return drop_from_peak >= trailing_percent
     
-    def should_time_exit(self, max_hours: int) -> bool:
-        """Check if maximum hold time is exceeded"""
+    def should_time_exit(self, now_ts: float, max_hours: int) -> bool:
+        """Check if maximum hold time is exceeded (now_ts from time.monotonic())"""
         if max_hours <= 0:
             return False
         
-        hold_time = datetime.now() - self.entry_time
-        return hold_time > timedelta(hours=max_hours)
+        return now_ts - self.entry_mono > max_hours * 3600
+    
+    def check_exit(
+        self,
+        target_percent: float,
+        stop_percent: float,
+        trailing_percent: float,
+        now_ts: float,
+        max_hours: int
+    ) -> Optional[ExitReason]:
+        """
+        Evaluate all exit conditions in one pass
+        
+        Same priority as the individual should_* checks: profit target,
+        stop loss, trailing stop, time limit. Returns None to keep holding.
+        now_ts is the caller's time.monotonic() reading for this tick.
+        """
+        pnl_percent = self.profit_loss_percent
+        if pnl_percent >= target_percent:
+            return _R_PROFIT
+        if pnl_percent <= -stop_percent:
+            return _R_STOP
+        
+        peak = self.peak_price
+        if peak > 0 and (peak - self.current_price) / peak * 100 >= trailing_percent:
+            return _R_TRAIL
+        
+        if self.should_time_exit(now_ts, max_hours):
+            return _R_TIME
+        return None
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
+        if self._closed_dict is not None:
+            return self._closed_dict
+        
         return {
             'position_id': self.position_id,
             'contract_address': self.contract_address,
             'chain': self.chain,
             'token_symbol': self.token_symbol,
-            'entry_time': self.entry_time.isoformat(),
+            'entry_time': self._entry_time_iso,
             'entry_price': self.entry_price,
             'entry_amount_usd': self.entry_amount_usd,
             'entry_amount_tokens': self.entry_amount_tokens,
@@ -196,12 +263,54 @@ class Position:
             'current_value_usd': self.current_value_usd,
             'profit_loss_usd': self.profit_loss_usd,
             'profit_loss_percent': self.profit_loss_percent,
-            'status': self.status.value,
+            'status': _STATUS_VALUES[self.status],
             'exit_reason': self.exit_reason.value if self.exit_reason else None,
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        to_dict() encoded as JSON
+        
+        Closed positions are encoded once. Open positions reuse the encoded
+        entry fields and only encode the fields that move with price.
+        """
+        if self._closed_json is not None:
+            return self._closed_json
+        if self._closed_dict is not None:
+            self._closed_json = orjson.dumps(self._closed_dict)
+            return self._closed_json
+        
+        head = self._json_head
+        if not head:
+            head = self._json_head = orjson.dumps({
+                'position_id': self.position_id,
+                'contract_address': self.contract_address,
+                'chain': self.chain,
+                'token_symbol': self.token_symbol,
+                'entry_time': self._entry_time_iso,
+                'entry_price': self.entry_price,
+                'entry_amount_usd': self.entry_amount_usd,
+                'entry_amount_tokens': self.entry_amount_tokens,
+            })[:-1] + b','
+        
+        # Splice the live fields in after the head (dropping their leading '{')
+        return head + orjson.dumps({
+            'current_price': self.current_price,
+            'current_value_usd': self.current_value_usd,
+            'profit_loss_usd': self.profit_loss_usd,
+            'profit_loss_percent': self.profit_loss_percent,
+            'status': _STATUS_VALUES[self.status],
+            'exit_reason': self.exit_reason.value if self.exit_reason else None,
+        })[1:]
+    
+    def freeze(self):
+        """Cache the final to_dict() once the position is closed"""
+        self._closed_dict = None
+        self._closed_json = None
+        self._closed_dict = self.to_dict()
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """Result of a trade execution"""
     success: bool
@@ -234,10 +343,28 @@ class TheHand:
         
         # Position tracking
         self.open_positions: Dict[str, Position] = {}
-        self.closed_positions: List[Position] = []
+        self._open_snapshot: Optional[Tuple[Position, ...]] = None  # rebuilt after buys/sells
+        self.closed_positions: Deque[Position] = deque(maxlen=self.config.CLOSED_HISTORY_CAP)
         
         # State
         self.is_running = False
+        self.state_version = 0  # bumped whenever positions or stats change (API ETags)
+        
+        # Private generator for dry-run price simulation
+        self._rng = random.Random()
+        
+        # Wakes the monitor loop before its next 5s tick
+        self._wake = asyncio.Event()
+        
+        # Chain executors, keyed by lowercase chain name
+        self._buy_dispatch = {
+            'ethereum': self._execute_ethereum_buy,
+            'solana': self._execute_solana_buy,
+        }
+        self._sell_dispatch = {
+            'ethereum': self._execute_ethereum_sell,
+            'solana': self._execute_solana_sell,
+        }
         
         # Performance tracking
         self.total_trades = 0
@@ -245,6 +372,10 @@ class TheHand:
         self.losing_trades = 0
         self.total_profit_usd = 0.0
         
+        # Running sums over closed trades (O(1) averages/variance in get_statistics)
+        self.sum_profit_sq = 0.0
+        self.sum_hold_seconds = 0.0
+        
     # ============================================
     # INITIALIZATION
     # ============================================
@@ -346,37 +477,37 @@ class TheHand:
         amount_usd = amount_usd or self.config.TRADE_AMOUNT_USD
         
         self.logger.info(
-            f"🎯 Executing BUY: {token_symbol} on {chain} "
-            f"Amount: ${amount_usd:.2f}"
+            "🎯 Executing BUY: %s on %s Amount: $%.2f",
+            token_symbol, chain, amount_usd
         )
         
         try:
             # Route to appropriate chain
-            if chain.lower() == 'ethereum':
-                result = await self._execute_ethereum_buy(contract_address, token_symbol, amount_usd)
-            elif chain.lower() == 'solana':
-                result = await self._execute_solana_buy(contract_address, token_symbol, amount_usd)
-            else:
+            execute = self._buy_dispatch.get(chain.lower())
+            if execute is None:
                 return TradeResult(
                     success=False,
                     error_message=f"Unsupported chain: {chain}"
                 )
+            result = await execute(contract_address, token_symbol, amount_usd)
             
             # Track position if successful
             if result.success and result.position:
                 self.open_positions[result.position.position_id] = result.position
+                self._open_snapshot = None
                 self.total_trades += 1
+                self.state_version += 1
+                self._wake.set()
                 
                 self.logger.info(
-                    f"✅ BUY executed: {token_symbol} | "
-                    f"Price: ${result.position.entry_price:.8f} | "
-                    f"Tokens: {result.position.entry_amount_tokens:.2f}"
+                    "✅ BUY executed: %s | Price: $%.8f | Tokens: %.2f",
+                    token_symbol, result.position.entry_price, result.position.entry_amount_tokens
                 )
             
             return result
             
         except Exception as e:
-            self.logger.error(f"❌ BUY failed: {e}")
+            self.logger.error("❌ BUY failed: %s", e)
             return TradeResult(
                 success=False,
                 error_message=str(e)
@@ -488,22 +619,19 @@ class TheHand:
         position = self.open_positions[position_id]
         
         self.logger.info(
-            f"🎯 Executing SELL: {position.token_symbol} | "
-            f"Reason: {reason.value} | "
-            f"P&L: {position.profit_loss_percent:+.2f}%"
+            "🎯 Executing SELL: %s | Reason: %s | P&L: %+.2f%%",
+            position.token_symbol, reason.value, position.profit_loss_percent
         )
         
         try:
-            # Route to appropriate chain
-            if position.chain == 'ethereum':
-                result = await self._execute_ethereum_sell(position)
-            elif position.chain == 'solana':
-                result = await self._execute_solana_sell(position)
-            else:
+            # Route to appropriate chain (Position.chain is stored lowercase)
+            execute = self._sell_dispatch.get(position.chain)
+            if execute is None:
                 return TradeResult(
                     success=False,
                     error_message=f"Unsupported chain: {position.chain}"
                 )
+            result = await execute(position)
             
             # Update position
             if result.success:
@@ -513,10 +641,13 @@ class TheHand:
                 position.exit_amount_usd = position.current_value_usd
                 position.exit_reason = reason
                 position.exit_tx_hash = result.tx_hash
+                position.freeze()
                 
                 # Move to closed positions
                 del self.open_positions[position_id]
+                self._open_snapshot = None
                 self.closed_positions.append(position)
+                self.state_version += 1
                 
                 # Update statistics
                 if position.profit_loss_usd > 0:
@@ -524,17 +655,20 @@ class TheHand:
                 else:
                     self.losing_trades += 1
                 
-                self.total_profit_usd += position.profit_loss_usd
+                pnl = position.profit_loss_usd
+                self.total_profit_usd += pnl
+                self.sum_profit_sq += pnl * pnl
+                self.sum_hold_seconds += time.monotonic() - position.entry_mono
                 
                 self.logger.info(
-                    f"✅ SELL executed: {position.token_symbol} | "
-                    f"P&L: ${position.profit_loss_usd:+.2f} ({position.profit_loss_percent:+.2f}%)"
+                    "✅ SELL executed: %s | P&L: $%+.2f (%+.2f%%)",
+                    position.token_symbol, position.profit_loss_usd, position.profit_loss_percent
                 )
             
             return result
             
         except Exception as e:
-            self.logger.error(f"❌ SELL failed: {e}")
+            self.logger.error("❌ SELL failed: %s", e)
             return TradeResult(
                 success=False,
                 error_message=str(e)
@@ -580,51 +714,72 @@ class TheHand:
     
     async def monitor_positions(self):
         """Monitor all open positions and execute exit strategies"""
+        config = self.config
         
         while self.is_running:
+            # Idle: nothing to price or check until a buy (or stop()) sets _wake
+            if not self.open_positions:
+                await self._wake.wait()
+                self._wake.clear()
+                continue
+            
             try:
-                for position_id, position in list(self.open_positions.items()):
-                    # Update current price (simplified - would fetch from DEX)
-                    await self._update_position_price(position)
-                    
-                    # Check exit conditions
-                    exit_reason = None
-                    
-                    # 1. Profit target
-                    if position.should_take_profit(self.config.PROFIT_TARGET_PERCENT):
-                        exit_reason = ExitReason.PROFIT_TARGET
-                    
-                    # 2. Stop loss
-                    elif position.should_stop_loss(self.config.STOP_LOSS_PERCENT):
-                        exit_reason = ExitReason.STOP_LOSS
-                    
-                    # 3. Trailing stop
-                    elif position.should_trailing_stop(self.config.TRAILING_STOP_PERCENT):
-                        exit_reason = ExitReason.TRAILING_STOP
-                    
-                    # 4. Time limit
-                    elif position.should_time_exit(self.config.MAX_HOLD_TIME_HOURS):
-                        exit_reason = ExitReason.TIME_LIMIT
+                # One clock read and one config read per tick, shared by every position
+                now_ts = time.monotonic()
+                profit_target = config.PROFIT_TARGET_PERCENT
+                stop_loss = config.STOP_LOSS_PERCENT
+                trailing_stop = config.TRAILING_STOP_PERCENT
+                max_hold_hours = config.MAX_HOLD_TIME_HOURS
+                
+                # Update current prices (simplified - would fetch from DEX)
+                await self._batch_update_prices()
+                self.state_version += 1
+                
+                # Scan the live dict; sells (which remove entries) are
+                # deferred until the scan is done
+                exits = []
+                for position_id, position in self.open_positions.items():
+                    # Check exit conditions (profit, stop, trailing, time)
+                    exit_reason = position.check_exit(
+                        profit_target, stop_loss, trailing_stop, now_ts, max_hold_hours
+                    )
                     
-                    # Execute sell if any condition met
                     if exit_reason:
-                        await self.execute_sell(position_id, exit_reason)
+                        exits.append((position_id, exit_reason))
+                
+                # Execute sells for every position that met a condition
+                for position_id, exit_reason in exits:
+                    await self.execute_sell(position_id, exit_reason)
                 
-                # Sleep before next check
-                await asyncio.sleep(5)
+                # Sleep before next check (stop() / a new buy wake us early)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
                 
             except Exception as e:
-                self.logger.error(f"Position monitoring error: {e}")
+                self.logger.error("Position monitoring error: %s", e)
                 await asyncio.sleep(10)
     
+    async def _batch_update_prices(self):
+        """
+        Refresh prices for every open position concurrently
+        
+        Real DEX quotes belong here grouped per chain: one Multicall3
+        batch on Ethereum, one Jupiter /price?ids=... call on Solana.
+        """
+        updates = [self._update_position_price(p) for p in self.open_positions.values()]
+        if updates:
+            await asyncio.gather(*updates)
+    
     async def _update_position_price(self, position: Position):
         """Update position with current price"""
         
         # In dry run mode, simulate price movement
         if self.config.DRY_RUN_MODE:
             # Random walk simulation
-            import random
-            change_percent = random.uniform(-5, 15)  # Bias towards profit for testing
+            change_percent = self._rng.uniform(-5, 15)  # Bias towards profit for testing
             new_price = position.current_price * (1 + change_percent / 100)
             position.update_current_price(new_price)
         else:
@@ -646,18 +801,31 @@ class TheHand:
     async def stop(self):
         """Stop all operations"""
         self.is_running = False
+        self._wake.set()
         
         if self.solana_client:
             await self.solana_client.close()
         
         self.logger.info("✋ The Hand has stopped")
     
-    def get_statistics(self) -> Dict:
-        """Get trading statistics"""
-        win_rate = (
+    @property
+    def win_rate(self) -> float:
+        """Winning trades as a percentage of all trades (O(1) from counters)"""
+        return (
             (self.winning_trades / self.total_trades * 100)
             if self.total_trades > 0 else 0
         )
+    
+    def get_statistics(self) -> Dict:
+        """Get trading statistics"""
+        win_rate = self.win_rate
+        
+        closed = self.winning_trades + self.losing_trades
+        avg_profit = self.total_profit_usd / closed if closed else 0.0
+        profit_variance = (
+            max(self.sum_profit_sq / closed - avg_profit * avg_profit, 0.0)
+            if closed else 0.0
+        )
         
         return {
             'total_trades': self.total_trades,
@@ -666,12 +834,17 @@ class TheHand:
             'win_rate': win_rate,
             'total_profit_usd': self.total_profit_usd,
             'open_positions': len(self.open_positions),
-            'closed_positions': len(self.closed_positions),
+            'closed_positions': closed,
+            'avg_profit_usd': avg_profit,
+            'profit_variance_usd': profit_variance,
+            'avg_hold_seconds': self.sum_hold_seconds / closed if closed else 0.0,
         }
     
-    def get_open_positions(self) -> List[Position]:
-        """Get all open positions"""
-        return list(self.open_positions.values())
+    def get_open_positions(self) -> Tuple[Position, ...]:
+        """Get all open positions (read-only snapshot, shared until the set changes)"""
+        if self._open_snapshot is None:
+            self._open_snapshot = tuple(self.open_positions.values())
+        return self._open_snapshot
 
 
 # ============================================
@@ -1,55 +1,190 @@
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import (
+    BackgroundTasks, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+)
+from fastapi.responses import ORJSONResponse
 import uvicorn
 import os
-import json
-from typing import Optional, Dict, List
-from datetime import datetime
+import orjson
+import time
+from cachetools import TTLCache
+from itertools import islice
+from typing import Optional, Dict, List, Tuple
 
 # Import chat system
-from chat_system import get_chat_coordinator, ChatMessage, AgentType
+from chat_system import (
+    get_chat_coordinator, ChatMessage, AgentType, now_iso,
+    msgpack, MSGPACK_AVAILABLE, MSGPACK_SUBPROTOCOL
+)
 
 # Global reference to the running engine
 # This will be set by heist_engine.py when it starts
 engine_instance = None
 chat = get_chat_coordinator()
 
+# (ETag, encoded body) of the last /status response
+_status_cache: Optional[Tuple[str, bytes]] = None
+
+# Encoded bodies of the polled endpoints, reused for a short window so
+# dashboard polls skip rebuilding and re-encoding the same payload
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv('API_CACHE_TTL_SECONDS', '0.5'))
+_response_cache = TTLCache(maxsize=64, ttl=RESPONSE_CACHE_TTL_SECONDS, timer=time.monotonic)
+
+# permessage-deflate on /ws/chat (uvicorn's websockets impl, context takeover
+# on); WS_COMPRESS=0 turns it off for latency-sensitive deployments
+WS_COMPRESS = os.getenv('WS_COMPRESS', '1') != '0'
+
 def set_engine(engine):
     """Set the global engine instance"""
-    global engine_instance
+    global engine_instance, _status_cache
     engine_instance = engine
+    _status_cache = None
+    _response_cache.clear()
+
+def _json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Send already-encoded JSON as-is"""
+    return Response(body, media_type="application/json", headers=headers)
 
-app = FastAPI(title="Heist Engine API", version="1.0.0")
+def _json_array(items) -> bytes:
+    """JSON array stitched from each item's cached to_json_bytes()"""
+    return b"[" + b",".join(item.to_json_bytes() for item in items) + b"]"
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all for now to support local dev and Stellar
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+app = FastAPI(
+    title="Heist Engine API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson encoding for every JSON route
 )
 
+# ============================================
+# CORS
+# ============================================
+
+# Comma-separated origin allowlist; "*" (default) allows any origin, which
+# keeps local dev and Stellar working
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.getenv('CORS_ORIGINS', '*').split(',') if origin.strip()
+)
+
+class FastCORSMiddleware:
+    """
+    Minimal pure-ASGI CORS for this API
+    
+    Header values are encoded once at startup; preflights are answered
+    straight from those without reaching the app. Explicit methods/headers
+    and no credentials let browsers cache the preflight for max_age seconds.
+    """
+    
+    def __init__(self, app, origins: frozenset, methods=("GET", "POST"),
+                 headers=("content-type", "if-none-match"), max_age: int = 86400):
+        self.app = app
+        self.allow_all = "*" in origins
+        self.origins = frozenset(origin.encode() for origin in origins)
+        self.any_origin_headers = [(b"access-control-allow-origin", b"*")]
+        self.preflight_headers = [
+            (b"access-control-allow-methods", ", ".join(methods).encode()),
+            (b"access-control-allow-headers", ", ".join(headers).encode()),
+            (b"access-control-max-age", str(max_age).encode()),
+        ]
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        origin = None
+        preflight = False
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                preflight = scope["method"] == "OPTIONS"
+        
+        if origin is None:
+            return await self.app(scope, receive, send)
+        
+        if self.allow_all:
+            cors_headers = self.any_origin_headers
+        elif origin in self.origins:
+            cors_headers = [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        else:
+            # No CORS headers: the browser blocks the response
+            return await self.app(scope, receive, send)
+        
+        if preflight:
+            await send({
+                "type": "http.response.start",
+                "status": 204,
+                "headers": cors_headers + self.preflight_headers
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+app.add_middleware(FastCORSMiddleware, origins=CORS_ORIGINS)
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """304 response if the client already holds this ETag, else None"""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+# Constant bodies, encoded once at import
+_ROOT_BYTES = orjson.dumps({
+    "status": "online",
+    "service": "Heist Engine",
+    "version": "1.0.0",
+    "engineer": "MANE_25-10-20"
+})
+_STATUS_OFFLINE_BYTES = orjson.dumps({"status": "offline", "message": "Engine not initialized"})
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
-    return {
-        "status": "online",
-        "service": "Heist Engine",
-        "version": "1.0.0",
-        "engineer": "MANE_25-10-20"
-    }
+    return _json_response(_ROOT_BYTES)
 
 @app.get("/status")
-async def get_status():
+async def get_status(request: Request):
     """Get comprehensive engine status"""
     if not engine_instance:
-        return {"status": "offline", "message": "Engine not initialized"}
+        return _json_response(_STATUS_OFFLINE_BYTES)
+    
+    # Weak ETag over everything the payload is derived from
+    hand = engine_instance.hand
+    etag = (
+        f'W/"{hand.state_version if hand else 0}-{engine_instance.signals_detected}-'
+        f'{engine_instance.signals_passed_audit}-{engine_instance.trades_executed}-'
+        f'{int(engine_instance.is_running)}"'
+    )
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
-    # Get stats from The Hand
-    hand_stats = engine_instance.hand.get_statistics() if engine_instance.hand else {}
+    # Serve the encoded payload as long as its ETag is current
+    global _status_cache
+    if _status_cache is not None and _status_cache[0] == etag:
+        body = _status_cache[1]
+    else:
+        body = _build_status(hand)
+        _status_cache = (etag, body)
     
-    return {
+    return _json_response(body, {"ETag": etag})
+
+def _build_status(hand) -> bytes:
+    """Encode the /status payload"""
+    # Read The Hand's running counters directly; the full get_statistics()
+    # dict (averages, variance) isn't needed for these three fields
+    if hand:
+        open_positions = len(hand.open_positions)
+        total_pnl_usd = hand.total_profit_usd
+        win_rate = hand.win_rate
+    else:
+        open_positions, total_pnl_usd, win_rate = 0, 0.0, 0.0
+    
+    return orjson.dumps({
         "status": "running" if engine_instance.is_running else "stopped",
         "uptime_seconds": 0,  # TODO: Add uptime tracking
         "simulation_mode": engine_instance.config.MIN_HYPE_SCORE == 70, # Rough check
@@ -57,11 +192,11 @@ async def get_status():
             "signals_detected": engine_instance.signals_detected,
             "signals_passed_audit": engine_instance.signals_passed_audit,
             "trades_executed": engine_instance.trades_executed,
-            "open_positions": hand_stats.get('open_positions', 0),
-            "total_pnl_usd": hand_stats.get('total_profit_usd', 0.0),
-            "win_rate": hand_stats.get('win_rate', 0.0)
+            "open_positions": open_positions,
+            "total_pnl_usd": total_pnl_usd,
+            "win_rate": win_rate
         }
-    }
+    })
 
 @app.get("/signals")
 async def get_signals(limit: int = 20):
@@ -69,19 +204,39 @@ async def get_signals(limit: int = 20):
     if not engine_instance or not engine_instance.ear:
         return []
     
-    # Convert signals to dict
-    return [s.to_dict() for s in engine_instance.ear.get_top_signals(limit)]
+    key = f"signals:{limit}"
+    body = _response_cache.get(key)
+    if body is None:
+        body = _json_array(engine_instance.ear.get_top_signals(limit))
+        _response_cache[key] = body
+    return _json_response(body)
 
 @app.get("/positions")
-async def get_positions():
+async def get_positions(request: Request):
     """Get all open and closed positions"""
     if not engine_instance or not engine_instance.hand:
         return {"open": [], "closed": []}
     
-    return {
-        "open": [p.to_dict() for p in engine_instance.hand.get_open_positions()],
-        "closed": [p.to_dict() for p in engine_instance.hand.closed_positions[-20:]] # Last 20 closed
-    }
+    hand = engine_instance.hand
+    etag = f'W/"{hand.state_version}"'
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    
+    cached = _response_cache.get("positions")
+    if cached is not None and cached[0] == etag:
+        body = cached[1]
+    else:
+        # Last 20 closed, oldest first (closed_positions is a bounded deque);
+        # closed positions reuse their encoding from earlier polls
+        closed = reversed(list(islice(reversed(hand.closed_positions), 20)))
+        body = (
+            b'{"open":' + _json_array(hand.get_open_positions()) +
+            b',"closed":' + _json_array(closed) + b'}'
+        )
+        _response_cache["positions"] = (etag, body)
+    
+    return _json_response(body, {"ETag": etag})
 
 @app.get("/wallet")
 async def get_wallet():
@@ -89,46 +244,88 @@ async def get_wallet():
     if not engine_instance or not engine_instance.hand:
         return {"address": "Not Configured", "balance_eth": 0.0, "balance_sol": 0.0}
     
-    # In a real scenario, we would fetch balance from RPC
-    # For now, we return the configured address and a simulated balance
-    
-    return {
-        "address": engine_instance.hand.config.WALLET_ADDRESS or "0x... (Not Set)",
-        "balance_eth": 1.5, # Simulated balance
-        "balance_sol": 15.0, # Simulated balance
-        "is_dry_run": engine_instance.hand.config.DRY_RUN_MODE
-    }
+    body = _response_cache.get("wallet")
+    if body is None:
+        # In a real scenario, we would fetch balance from RPC
+        # For now, we return the configured address and a simulated balance
+        body = orjson.dumps({
+            "address": engine_instance.hand.config.WALLET_ADDRESS or "0x... (Not Set)",
+            "balance_eth": 1.5, # Simulated balance
+            "balance_sol": 15.0, # Simulated balance
+            "is_dry_run": engine_instance.hand.config.DRY_RUN_MODE
+        })
+        _response_cache["wallet"] = body
+    return _json_response(body)
+
+_STOP_ACCEPTED_BYTES = orjson.dumps({"message": "Engine shutdown initiated"})
+
+async def _shutdown_engine(engine):
+    """Run the engine shutdown, then drop responses cached from before it"""
+    await engine.shutdown()
+    _response_cache.clear()
 
 @app.post("/control/stop")
-async def stop_engine():
-    """Stop the engine"""
+async def stop_engine(background: BackgroundTasks):
+    """Stop the engine (202: shutdown continues after the response is sent)"""
     if not engine_instance:
         raise HTTPException(status_code=503, detail="Engine not initialized")
     
-    await engine_instance.shutdown()
-    return {"message": "Engine shutdown initiated"}
+    background.add_task(_shutdown_engine, engine_instance)
+    return Response(_STOP_ACCEPTED_BYTES, status_code=202, media_type="application/json")
+
+def _decode_chat_in(data, binary: bool) -> str:
+    """
+    Decode an inbound chat frame ({"message": str}) to its message text
+    
+    Binary frames on a msgpack connection are MessagePack; everything
+    else is JSON (orjson takes text or bytes frames as-is).
+    Raises ValueError for anything off-schema (bad encoding, non-object
+    payload, non-string message) so the caller has a single error path.
+    """
+    if binary and isinstance(data, bytes):
+        payload = msgpack.unpackb(data, raw=False)
+    else:
+        payload = orjson.loads(data)
+    if not isinstance(payload, dict):
+        raise ValueError("chat payload must be an object")
+    message = payload.get("message", "")
+    if not isinstance(message, str):
+        raise ValueError("chat message must be a string")
+    return message
 
 @app.websocket("/ws/chat")
 async def websocket_chat(websocket: WebSocket):
     """WebSocket endpoint for multi-agent chat"""
-    await websocket.accept()
-    await chat.connect(websocket)
+    # Clients offering the "msgpack" subprotocol get binary MessagePack
+    # frames both ways; everyone else keeps JSON text frames
+    binary = MSGPACK_AVAILABLE and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    # ?echo=0: client renders its own messages, so skip broadcasting them back
+    echo = websocket.query_params.get("echo", "1") != "0"
+    await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if binary else None)
+    await chat.connect(websocket, binary=binary)
     
     try:
         while True:
-            # Receive message from client
-            data = await websocket.receive_text()
+            # Receive message from client, text or binary frame
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            data = frame.get("bytes")
+            if data is None:
+                data = frame.get("text", "")
             
             try:
-                msg_data = json.loads(data)
-                user_message = msg_data.get("message", "")
+                user_message = _decode_chat_in(data, binary)
                 
+                # Echo + response are queued back to back, so each
+                # connection's writer flushes them as one batched frame
                 # Echo user message to all clients
-                await chat.broadcast(ChatMessage(
-                    agent=AgentType.USER.value,
-                    message=user_message,
-                    timestamp=datetime.now().isoformat()
-                ))
+                if echo:
+                    await chat.broadcast(ChatMessage(
+                        agent=AgentType.USER.value,
+                        message=user_message,
+                        timestamp=now_iso()
+                    ))
                 
                 # Handle message and get response
                 response = await chat.handle_user_message(user_message)
@@ -139,17 +336,30 @@ async def websocket_chat(websocket: WebSocket):
                     response
                 )
                 
-            except json.JSONDecodeError:
+            except ValueError:  # undecodable or off-schema payload
                 await chat.agent_message(
                     AgentType.SYSTEM,
                     "Invalid message format. Please send JSON."
                 )
                 
     except WebSocketDisconnect:
+        pass
+    finally:
         await chat.disconnect(websocket)
 
 if __name__ == "__main__":
     # Standalone run (mostly for testing API without engine)
+    # uvloop/httptools are picked up by "auto" when installed; extra workers
+    # are only safe here because no engine is attached to this process
     port = int(os.environ.get("PORT", 10000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(
+        "web_api:app",
+        host="0.0.0.0",
+        port=port,
+        loop="auto",
+        http="auto",
+        ws="websockets",
+        ws_per_message_deflate=WS_COMPRESS,
+        workers=int(os.environ.get("WEB_WORKERS", "1"))
+    )
 